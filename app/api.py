@@ -3,30 +3,42 @@ FastAPI backend for ChatterboxTTS Desktop
 """
 
 import asyncio
+import functools
+import io
 import json
 import os
+import struct
 import tempfile
-from typing import List, Optional
-from datetime import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional
 import base64
 
 from fastapi import FastAPI, HTTPException, UploadFile, File, WebSocket, WebSocketDisconnect
+from fastapi.encoders import jsonable_encoder
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse, HTMLResponse
-from pydantic import BaseModel
+from fastapi.responses import FileResponse, HTMLResponse, ORJSONResponse, Response, StreamingResponse
+from pydantic import BaseModel, ConfigDict
+import numpy as np
+import orjson
 import uvicorn
 
+from console import console_icon
 from model_manager import ModelManager
-from tts_service import TTSService
+from tts_service import TTSService, write_pcm16_wav
 from voice_manager import VoiceManager
 
 
 # Pydantic models for API
 class TTSRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+    
     text: str
     voice: str = "Default"
     exaggeration: float = 0.5
     cfg_weight: float = 0.5
+    use_cache: bool = False  # Reuse the previous take for identical requests
 
 
 class TTSResponse(BaseModel):
@@ -57,26 +69,87 @@ class SystemStatus(BaseModel):
     last_used: Optional[float] = None
 
 
+# Project paths, resolved once at import
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+WEB_DIR = PROJECT_ROOT / "web"
+OUTPUTS_DIR = PROJECT_ROOT / "outputs"
+
+# Set CHATTERBOX_PRELOAD=1 to load the model at startup instead of on first use
+PRELOAD_MODEL = os.environ.get("CHATTERBOX_PRELOAD", "0") == "1"
+
+# Memory budget for cached takes (requests opt in with use_cache)
+AUDIO_CACHE_MB = int(os.environ.get("CHATTERBOX_AUDIO_CACHE_MB", "100"))
+
+# 10,000 characters plus the JSON envelope fit comfortably in 64KB
+MAX_GENERATE_BODY_BYTES = 64 * 1024
+
+
+class GenerateBodyLimitMiddleware:
+    """ASGI middleware that rejects oversized generate requests before the body is read."""
+    
+    def __init__(self, app, max_body_bytes: int = MAX_GENERATE_BODY_BYTES):
+        self.app = app
+        self.max_body_bytes = max_body_bytes
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"].startswith("/api/generate"):
+            for header, value in scope["headers"]:
+                if header == b"content-length":
+                    if value.isdigit() and int(value) > self.max_body_bytes:
+                        response = ORJSONResponse(
+                            {"detail": "Request body too large"}, status_code=413
+                        )
+                        await response(scope, receive, send)
+                        return
+                    break
+        
+        await self.app(scope, receive, send)
+
+
 # FastAPI app
-app = FastAPI(title="ChatterboxTTS Desktop API", version="1.0.0")
+app = FastAPI(
+    title="ChatterboxTTS Desktop API",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    # The web UI doesn't use the interactive docs; skip building the OpenAPI schema
+    docs_url=None,
+    redoc_url=None,
+    openapi_url=None
+)
+app.add_middleware(GenerateBodyLimitMiddleware)
 
 # Initialize services
 model_manager = ModelManager()
 voice_manager = VoiceManager()
-tts_service = TTSService(model_manager, voice_manager)
+tts_service = TTSService(model_manager, voice_manager, audio_cache_mb=AUDIO_CACHE_MB)
+
+# Model calls run on a single worker thread: the GPU is used one request at
+# a time, while the event loop stays free to serve status and voice requests
+tts_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tts")
+
+
+# Serialized /api/voices body, rebuilt only after a voice is added or deleted
+_voices_body: Optional[bytes] = None
+
+
+async def run_in_tts_thread(func, *args, **kwargs):
+    """Run a blocking model call on the TTS worker thread."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(tts_executor, functools.partial(func, *args, **kwargs))
+
 
 # Serve static files
-app.mount("/static", StaticFiles(directory="web"), name="static")
+app.mount("/static", StaticFiles(directory=WEB_DIR), name="static")
 
 
 @app.get("/", response_class=HTMLResponse)
 async def get_index():
     """Serve the main HTML page."""
-    with open("web/index.html", "r") as f:
+    with open(WEB_DIR / "index.html", "r") as f:
         return HTMLResponse(content=f.read())
 
 
-@app.get("/api/status", response_model=SystemStatus)
+@app.get("/api/status")
 async def get_system_status():
     """Get current system status."""
     stats = model_manager.get_memory_stats()
@@ -96,8 +169,8 @@ async def get_system_status():
 async def preload_model():
     """Preload the TTS model into memory."""
     try:
-        # This will load the model if not already loaded
-        model = model_manager.get_model()
+        # Load the model if needed and warm it up with a short generation
+        await run_in_tts_thread(tts_service.warm_up)
         
         return {
             "success": True,
@@ -108,41 +181,55 @@ async def preload_model():
         raise HTTPException(status_code=500, detail=f"Failed to load model: {str(e)}")
 
 
-@app.get("/api/voices", response_model=List[VoiceInfo])
+@app.get("/api/voices")
 async def get_voices():
     """Get list of available voices."""
-    voices = []
-    voice_list = voice_manager.get_voice_list()
+    global _voices_body
     
-    for voice_name in voice_list:
-        info = voice_manager.get_voice_info(voice_name)
-        if info:
-            voices.append(VoiceInfo(**info))
+    if _voices_body is None:
+        voices = []
+        voice_list = voice_manager.get_voice_list()
+        
+        for voice_name in voice_list:
+            info = voice_manager.get_voice_info(voice_name)
+            if info:
+                voices.append(VoiceInfo(**info))
+        
+        _voices_body = orjson.dumps(jsonable_encoder(voices))
     
-    return voices
+    return Response(content=_voices_body, media_type="application/json")
 
 
 @app.post("/api/voices/upload")
 async def upload_voice(name: str, file: UploadFile = File(...)):
     """Upload a new voice sample."""
+    global _voices_body
+    
     if not name.strip():
         raise HTTPException(status_code=400, detail="Voice name is required")
     
-    # Save uploaded file temporarily
-    with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(file.filename)[1]) as temp_file:
-        content = await file.read()
+    content = await file.read()
+    
+    # Disk writes and audio decoding happen off the event loop
+    success, message = await asyncio.to_thread(
+        _add_voice_from_upload, name.strip(), os.path.splitext(file.filename)[1], content
+    )
+    
+    if success:
+        _voices_body = None
+        return {"success": True, "message": message}
+    else:
+        raise HTTPException(status_code=400, detail=message)
+
+
+def _add_voice_from_upload(name: str, suffix: str, content: bytes):
+    """Save uploaded audio to a temp file and add it as a voice."""
+    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as temp_file:
         temp_file.write(content)
         temp_path = temp_file.name
     
     try:
-        # Add voice using voice_manager
-        success, message = voice_manager.add_voice(name.strip(), temp_path)
-        
-        if success:
-            return {"success": True, "message": message}
-        else:
-            raise HTTPException(status_code=400, detail=message)
-    
+        return voice_manager.add_voice(name, temp_path)
     finally:
         # Clean up temp file
         if os.path.exists(temp_path):
@@ -152,54 +239,56 @@ async def upload_voice(name: str, file: UploadFile = File(...)):
 @app.delete("/api/voices/{voice_name}")
 async def delete_voice(voice_name: str):
     """Delete a voice."""
+    global _voices_body
+    
     if voice_name == "Default":
         raise HTTPException(status_code=400, detail="Cannot delete default voice")
     
-    success, message = voice_manager.delete_voice(voice_name)
+    # Runs off the event loop: it may wait on the voice lock held by an upload
+    success, message = await asyncio.to_thread(voice_manager.delete_voice, voice_name)
     
     if success:
+        _voices_body = None
         return {"success": True, "message": message}
     else:
         raise HTTPException(status_code=400, detail=message)
 
 
-@app.post("/api/generate", response_model=TTSResponse)
+async def _generate_audio(request: TTSRequest):
+    """Return (audio_tensor, sample_rate), serving cache hits without queueing on the TTS thread."""
+    if request.use_cache:
+        cached = tts_service.get_cached(
+            request.text, request.voice, request.exaggeration, request.cfg_weight
+        )
+        if cached is not None:
+            return cached
+    
+    return await run_in_tts_thread(
+        tts_service.generate_speech,
+        text=request.text,
+        voice_profile=request.voice,
+        exaggeration=request.exaggeration,
+        cfg_weight=request.cfg_weight,
+        use_cache=request.use_cache
+    )
+
+
+@app.post("/api/generate")
 async def generate_speech(request: TTSRequest):
     """Generate speech from text."""
     try:
-        import time
-        import torch
-        import torchaudio as ta
-        import io
-        
-        start_time = time.time()
-        
-        # Generate audio
-        audio_tensor, sample_rate = tts_service.generate_speech(
-            text=request.text,
-            voice_profile=request.voice,
-            exaggeration=request.exaggeration,
-            cfg_weight=request.cfg_weight
-        )
-        
-        generation_time = time.time() - start_time
+        start_time = time.perf_counter()
         
-        # Convert to WAV bytes
-        audio_np = audio_tensor.squeeze().cpu().numpy()
-        duration = len(audio_np) / sample_rate
+        audio_tensor, sample_rate = await _generate_audio(request)
         
-        # Create WAV file in memory
-        buffer = io.BytesIO()
+        generation_time = time.perf_counter() - start_time
         
-        # Ensure audio is 2D (channels, samples)
-        if audio_tensor.dim() == 1:
-            audio_tensor = audio_tensor.unsqueeze(0)
+        # generate_speech already returns a CPU tensor; duration comes straight from the sample count
+        duration = audio_tensor.shape[-1] / sample_rate
         
-        ta.save(buffer, audio_tensor, sample_rate, format="wav")
-        buffer.seek(0)
-        
-        # Encode as base64
-        audio_b64 = base64.b64encode(buffer.getvalue()).decode()
+        # Encode as 16-bit PCM WAV, then base64
+        wav_bytes = _encode_wav(audio_tensor.squeeze().numpy(), sample_rate)
+        audio_b64 = base64.b64encode(wav_bytes).decode()
         
         return TTSResponse(
             success=True,
@@ -214,6 +303,98 @@ async def generate_speech(request: TTSRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/api/generate-bytes")
+async def generate_speech_bytes(request: TTSRequest, save: bool = False):
+    """Generate speech and return it as raw WAV bytes."""
+    try:
+        start_time = time.perf_counter()
+        
+        audio_tensor, sample_rate = await _generate_audio(request)
+        
+        generation_time = time.perf_counter() - start_time
+        
+        audio_np = audio_tensor.squeeze().numpy()
+        duration = audio_tensor.shape[-1] / sample_rate
+        
+        # Optionally keep a copy on disk for debugging
+        if save:
+            timestamp = time.strftime("%Y%m%d_%H%M%S")
+            await asyncio.to_thread(
+                tts_service.save_audio,
+                audio_tensor, sample_rate, str(OUTPUTS_DIR / f"chatterbox_output_{timestamp}.wav")
+            )
+        
+        # Generation stats travel as headers so the body stays plain WAV
+        return Response(
+            content=_encode_wav(audio_np, sample_rate),
+            media_type="audio/wav",
+            headers={
+                "X-Audio-Duration": f"{duration:.3f}",
+                "X-Generation-Time": f"{generation_time:.3f}",
+                "X-Sample-Rate": str(sample_rate)
+            }
+        )
+        
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.post("/api/generate-stream")
+async def generate_speech_stream(request: TTSRequest):
+    """Generate speech and stream it as WAV, one text chunk at a time."""
+    chunks = tts_service.generate_speech_chunks(
+        text=request.text,
+        voice_profile=request.voice,
+        exaggeration=request.exaggeration,
+        cfg_weight=request.cfg_weight
+    )
+    
+    # Produce the first chunk up front so errors still return a proper status
+    try:
+        first_chunk = await run_in_tts_thread(next, chunks, None)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    
+    if first_chunk is None:
+        raise HTTPException(status_code=500, detail="No audio was generated")
+    
+    audio_tensor, sample_rate = first_chunk
+    
+    async def wav_stream():
+        yield _streaming_wav_header(sample_rate)
+        yield _pcm16_bytes(audio_tensor.squeeze().cpu().numpy())
+        
+        while True:
+            chunk = await run_in_tts_thread(next, chunks, None)
+            if chunk is None:
+                break
+            yield _pcm16_bytes(chunk[0].squeeze().cpu().numpy())
+    
+    return StreamingResponse(wav_stream(), media_type="audio/wav")
+
+
+def _encode_wav(audio_np, sample_rate: int) -> bytes:
+    """Encode a mono waveform as 16-bit PCM WAV bytes in memory."""
+    buffer = io.BytesIO()
+    write_pcm16_wav(buffer, audio_np, sample_rate)
+    return buffer.getvalue()
+
+
+def _streaming_wav_header(sample_rate: int) -> bytes:
+    """Build a mono 16-bit PCM WAV header with unknown length for streaming."""
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", 0xFFFFFFFF, b"WAVE",
+        b"fmt ", 16, 1, 1, sample_rate, sample_rate * 2, 2, 16,
+        b"data", 0xFFFFFFFF
+    )
+
+
+def _pcm16_bytes(audio_np) -> bytes:
+    """Convert a float waveform to little-endian 16-bit PCM bytes."""
+    return (np.clip(audio_np, -1.0, 1.0) * 32767).astype("<i2").tobytes()
+
+
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     """WebSocket for real-time updates."""
@@ -238,19 +419,40 @@ async def websocket_endpoint(websocket: WebSocket):
         pass
 
 
+@app.on_event("startup")
+async def startup_event():
+    """Prepare directories and optionally warm up the model."""
+    OUTPUTS_DIR.mkdir(exist_ok=True)
+    
+    if PRELOAD_MODEL:
+        # Load in the background so the server starts accepting requests immediately
+        app.state.preload_task = asyncio.create_task(_preload_model_on_startup())
+
+
+async def _preload_model_on_startup():
+    """Load and warm up the model at startup without failing server startup."""
+    try:
+        await run_in_tts_thread(tts_service.warm_up)
+    except Exception as e:
+        print(f"Warning: Model preload failed: {e}")
+
+
 @app.on_event("shutdown")
 async def shutdown_event():
     """Clean up resources on shutdown."""
     model_manager.shutdown()
+    tts_executor.shutdown(wait=False)
 
 
 if __name__ == "__main__":
-    print("🚀 Starting ChatterboxTTS Desktop Web UI...")
-    print("📱 Opening at: http://localhost:8000")
+    print(f"{console_icon('🚀')}Starting ChatterboxTTS Desktop Web UI...")
+    print(f"{console_icon('📱')}Opening at: http://localhost:8000")
     
     uvicorn.run(
         app,
         host="127.0.0.1",
         port=8000,
-        log_level="info"
+        log_level="info",
+        access_log=False,  # Skip per-request access logging
+        workers=1  # Each worker would load its own copy of the model
     )
\ No newline at end of file
@@ -0,0 +1,14 @@
+"""
+Console output helpers shared by the launchers
+"""
+
+import sys
+
+
+# Checked once; consoles without UTF-8 (e.g. cp1252 on Windows) can't encode emoji
+UTF8_CONSOLE = (sys.stdout.encoding or "").lower().startswith("utf")
+
+
+def console_icon(icon: str) -> str:
+    """Return an emoji prefix for console output, or nothing if the console can't print it."""
+    return f"{icon} " if UTF8_CONSOLE else ""
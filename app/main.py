@@ -11,15 +11,19 @@ import os
 # Add app directory to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+from console import console_icon
 from ui import ChatterboxUI
 
 
 def main():
     """Main entry point for the application."""
-    print("=" * 60)
-    print("🗣️  ChatterboxTTS Desktop")
-    print("   High-quality local text-to-speech generation")
-    print("=" * 60)
+    sys.stdout.write(
+        "=" * 60 + "\n"
+        + console_icon("🗣️ ") + "ChatterboxTTS Desktop\n"
+        "   High-quality local text-to-speech generation\n"
+        + "=" * 60 + "\n"
+    )
+    sys.stdout.flush()
     
     # Create and launch UI
     app = ChatterboxUI()
@@ -45,7 +45,7 @@ class ModelManager:
             # Load model if not cached or expired
             if self.model is None:
                 print("Loading ChatterboxTTS model...")
-                start_time = time.time()
+                start_time = time.perf_counter()
                 
                 self.model = ChatterboxTTS.from_pretrained(device=self.device)
                 
@@ -57,7 +57,7 @@ class ModelManager:
                     except Exception as e:
                         print(f"Warning: torch.compile failed: {e}")
                 
-                load_time = time.time() - start_time
+                load_time = time.perf_counter() - start_time
                 print(f"Model loaded in {load_time:.2f} seconds")
             
             self.last_used = current_time
@@ -1,22 +1,38 @@
 import re
+import hashlib
+import threading
 import torch
-import torchaudio as ta
 import numpy as np
-from typing import List, Tuple
+import soundfile as sf
+from collections import OrderedDict
+from typing import BinaryIO, Iterator, List, Optional, Tuple, Union
 from model_manager import ModelManager
 from voice_manager import VoiceManager
 
 
+def write_pcm16_wav(file: Union[str, BinaryIO], audio_np: np.ndarray, sample_rate: int):
+    """Write float audio in [-1, 1] as 16-bit PCM WAV, clipping anything out of range."""
+    sf.write(file, np.clip(audio_np, -1.0, 1.0), sample_rate, format="WAV", subtype="PCM_16")
+
+
 class TTSService:
     """Handles text processing and TTS generation."""
     
-    def __init__(self, model_manager: ModelManager, voice_manager: VoiceManager):
+    def __init__(self, model_manager: ModelManager, voice_manager: VoiceManager,
+                 audio_cache_mb: int = 100):
         self.model_manager = model_manager
         self.voice_manager = voice_manager
         self.max_chunk_length = 300  # Characters
         
+        # LRU cache of generated audio keyed by request; 0 disables caching
+        self.audio_cache_bytes = audio_cache_mb * 1024 * 1024
+        self._audio_cache: "OrderedDict[str, Tuple[torch.Tensor, int]]" = OrderedDict()
+        self._audio_cache_size = 0
+        self._cache_lock = threading.Lock()
+        
     def generate_speech(self, text: str, voice_profile: str = "Default", 
-                       exaggeration: float = 0.5, cfg_weight: float = 0.5) -> Tuple[torch.Tensor, int]:
+                       exaggeration: float = 0.5, cfg_weight: float = 0.5,
+                       use_cache: bool = False) -> Tuple[torch.Tensor, int]:
         """
         Generate speech from text.
         
@@ -25,10 +41,43 @@ class TTSService:
             voice_profile: Voice to use ("Default" or custom voice name)
             exaggeration: Emotion control (0.0 to 1.0)
             cfg_weight: Generation control (0.0 to 1.0)
+            use_cache: Reuse a previous take for identical requests. Generation
+                is sampled, so leave this off to get a fresh take every time.
             
         Returns:
             Tuple of (audio_tensor, sample_rate)
         """
+        cache_key = None
+        if use_cache:
+            cache_key = self._cache_key(text, voice_profile, exaggeration, cfg_weight)
+            cached = self._get_cached_audio(cache_key)
+            if cached is not None:
+                return cached
+        
+        audio_chunks = []
+        for wav, sample_rate in self.generate_speech_chunks(text, voice_profile, exaggeration, cfg_weight):
+            audio_chunks.append(wav)
+        
+        # Concatenate chunks
+        if len(audio_chunks) == 1:
+            final_audio = audio_chunks[0]
+        else:
+            final_audio = torch.cat(audio_chunks, dim=-1)
+        
+        final_audio = final_audio.detach().cpu()
+        if use_cache:
+            self._cache_audio(cache_key, final_audio, sample_rate)
+        
+        return final_audio, sample_rate
+    
+    def generate_speech_chunks(self, text: str, voice_profile: str = "Default",
+                               exaggeration: float = 0.5, cfg_weight: float = 0.5) -> Iterator[Tuple[torch.Tensor, int]]:
+        """
+        Generate speech one text chunk at a time.
+        
+        Takes the same arguments as generate_speech, but yields
+        (audio_tensor, sample_rate) as soon as each chunk is synthesized.
+        """
         if len(text) > 10000:
             raise ValueError("Text exceeds 10,000 character limit")
         
@@ -49,7 +98,6 @@ class TTSService:
         chunks = self._chunk_text(text) if len(text) > self.max_chunk_length else [text]
         
         # Generate audio for each chunk
-        audio_chunks = []
         for i, chunk in enumerate(chunks):
             if audio_prompt_path:
                 print(f"Generating chunk {i+1}/{len(chunks)} with voice '{voice_profile}': {len(chunk)} chars")
@@ -70,15 +118,51 @@ class TTSService:
                     exaggeration=exaggeration, 
                     cfg_weight=cfg_weight
                 )
-            audio_chunks.append(wav)
-        
-        # Concatenate chunks
-        if len(audio_chunks) == 1:
-            final_audio = audio_chunks[0]
-        else:
-            final_audio = torch.cat(audio_chunks, dim=-1)
-        
-        return final_audio, model.sr
+            yield wav, model.sr
+    
+    def warm_up(self):
+        """Load the model and, if it was just loaded, run a short generation so the first real request is fast."""
+        needs_warm_up = self.model_manager.model is None
+        model = self.model_manager.get_model()
+        if needs_warm_up:
+            model.generate("Hello.")
+    
+    def get_cached(self, text: str, voice_profile: str = "Default",
+                   exaggeration: float = 0.5, cfg_weight: float = 0.5) -> Optional[Tuple[torch.Tensor, int]]:
+        """Return a cached (audio_tensor, sample_rate) for this request, or None on a miss."""
+        return self._get_cached_audio(self._cache_key(text, voice_profile, exaggeration, cfg_weight))
+    
+    def _cache_key(self, text: str, voice_profile: str, exaggeration: float, cfg_weight: float) -> str:
+        """Build the audio cache key for a generation request."""
+        # Include the sample path so a re-created voice with the same name misses
+        voice_path = self.voice_manager.get_voice_sample_path(voice_profile)
+        key = f"{voice_profile}|{voice_path}|{exaggeration}|{cfg_weight}|{text}"
+        return hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+    
+    def _get_cached_audio(self, key: str) -> Optional[Tuple[torch.Tensor, int]]:
+        """Return cached audio for a key, marking it as recently used."""
+        with self._cache_lock:
+            entry = self._audio_cache.get(key)
+            if entry is not None:
+                self._audio_cache.move_to_end(key)
+            return entry
+    
+    def _cache_audio(self, key: str, audio_tensor: torch.Tensor, sample_rate: int):
+        """Store generated audio, evicting least recently used entries over budget."""
+        size = audio_tensor.element_size() * audio_tensor.nelement()
+        if size > self.audio_cache_bytes:
+            return
+        
+        with self._cache_lock:
+            if key in self._audio_cache:
+                return
+            
+            self._audio_cache[key] = (audio_tensor, sample_rate)
+            self._audio_cache_size += size
+            
+            while self._audio_cache_size > self.audio_cache_bytes:
+                _, (evicted, _) = self._audio_cache.popitem(last=False)
+                self._audio_cache_size -= evicted.element_size() * evicted.nelement()
     
     def _chunk_text(self, text: str) -> List[str]:
         """
@@ -147,9 +231,10 @@ class TTSService:
         if audio_tensor.dim() == 1:
             audio_tensor = audio_tensor.unsqueeze(0)  # Add channel dimension
         
-        # Save audio
+        # Save audio (16-bit PCM WAV is half the size of float32 with no audible loss)
         if format.lower() == "wav":
-            ta.save(filepath, audio_tensor, sample_rate)
+            # soundfile expects (samples, channels)
+            write_pcm16_wav(filepath, audio_tensor.detach().cpu().numpy().T, sample_rate)
         elif format.lower() == "mp3":
             # For MP3, we might need additional setup, but start with WAV
             # This would require additional dependencies like ffmpeg
@@ -6,6 +6,13 @@ from datetime import datetime
 from model_manager import ModelManager
 from tts_service import TTSService
 from voice_manager import VoiceManager
+from console import console_icon
+
+
+_LAUNCH_BANNER = (
+    f"{console_icon('🚀')}Starting ChatterboxTTS Desktop...\n"
+    f"{console_icon('📱')}Web interface will open at: http://{{host}}:{{port}}"
+)
 
 
 class ChatterboxUI:
@@ -18,6 +25,9 @@ class ChatterboxUI:
         self.current_audio = None
         self.current_sr = None
         
+        # Ensure outputs directory exists for exports
+        os.makedirs("outputs", exist_ok=True)
+        
     def generate_speech(self, text: str, voice_selection: str, exaggeration: float, cfg_weight: float, 
                        progress=gr.Progress()) -> tuple:
         """Generate speech and return audio for Gradio player."""
@@ -28,15 +38,16 @@ class ChatterboxUI:
             progress(0, desc="Starting generation...")
             
             # Generate audio
-            start_time = time.time()
+            start_time = time.perf_counter()
             audio_tensor, sample_rate = self.tts_service.generate_speech(
                 text, voice_profile=voice_selection, exaggeration=exaggeration, cfg_weight=cfg_weight
             )
             
-            generation_time = time.time() - start_time
+            generation_time = time.perf_counter() - start_time
             
-            # Convert to numpy for Gradio
-            audio_np = audio_tensor.squeeze().cpu().numpy()
+            # Move to CPU once and convert to numpy for Gradio
+            audio_tensor = audio_tensor.detach().cpu()
+            audio_np = audio_tensor.squeeze().numpy()
             
             # Store current audio
             self.current_audio = audio_tensor
@@ -45,7 +56,7 @@ class ChatterboxUI:
             progress(1.0, desc="Complete!")
             
             # Calculate stats
-            duration = len(audio_np) / sample_rate
+            duration = audio_tensor.shape[-1] / sample_rate
             speed_ratio = duration / generation_time if generation_time > 0 else 0
             
             status = (f"✅ Generated {duration:.1f}s audio in {generation_time:.1f}s "
@@ -67,9 +78,6 @@ class ChatterboxUI:
             filename = f"chatterbox_output_{timestamp}.{format_choice.lower()}"
             filepath = os.path.join("outputs", filename)
             
-            # Ensure outputs directory exists
-            os.makedirs("outputs", exist_ok=True)
-            
             # Save audio
             saved_path = self.tts_service.save_audio(
                 self.current_audio, self.current_sr, filepath, format_choice
@@ -367,14 +375,13 @@ class ChatterboxUI:
             **kwargs
         }
         
-        print("🚀 Starting ChatterboxTTS Desktop...")
-        print(f"📱 Web interface will open at: http://{launch_kwargs['server_name']}:{launch_kwargs['server_port']}")
+        print(_LAUNCH_BANNER.format(host=launch_kwargs['server_name'], port=launch_kwargs['server_port']))
         
         try:
             interface.launch(**launch_kwargs)
         except KeyboardInterrupt:
-            print("\n🛑 Shutting down...")
+            print(f"\n{console_icon('🛑')}Shutting down...")
             self.model_manager.shutdown()
         except Exception as e:
-            print(f"❌ Launch failed: {e}")
+            print(f"{console_icon('❌')}Launch failed: {e}")
             self.model_manager.shutdown()
\ No newline at end of file
@@ -1,13 +1,25 @@
 import os
+import re
 import json
+import threading
+import time
+import types
 import librosa
 import soundfile as sf
 import numpy as np
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Mapping, Optional, Sequence, Tuple
 from datetime import datetime
 from pathlib import Path
 
 
+# Info for the built-in voice never changes; a read-only view is shared between calls
+_DEFAULT_VOICE_INFO = types.MappingProxyType({
+    "name": "Default",
+    "type": "built-in",
+    "description": "High-quality default voice"
+})
+
+
 class VoiceProfile:
     """Represents a custom voice profile."""
     
@@ -52,11 +64,19 @@ class VoiceProfile:
 class VoiceManager:
     """Manages custom voice profiles and cloning functionality."""
     
+    # Characters not allowed in voice sample filenames
+    _UNSAFE_NAME_CHARS = re.compile(r'[^\w \-]')
+    
     def __init__(self, voices_dir: str = "voices", max_voices: int = 10):
         self.voices_dir = Path(voices_dir)
         self.max_voices = max_voices
         self.profiles_file = self.voices_dir / "profiles.json"
         self.voices: Dict[str, VoiceProfile] = {}
+        self._voice_list_cache: Tuple[str, ...] = ("Default",)
+        
+        # Serializes add/delete/load so capacity and name checks stay valid until the profile
+        # is saved, and so the voice list snapshot is always rebuilt from a consistent dict
+        self._lock = threading.Lock()
         
         # Create directories
         self.voices_dir.mkdir(exist_ok=True)
@@ -66,25 +86,33 @@ class VoiceManager:
     
     def _load_profiles(self):
         """Load voice profiles from JSON file."""
-        if self.profiles_file.exists():
-            try:
-                with open(self.profiles_file, 'r') as f:
-                    data = json.load(f)
-                    for voice_data in data.get("voices", []):
-                        profile = VoiceProfile.from_dict(voice_data)
-                        self.voices[profile.name] = profile
-            except Exception as e:
-                print(f"Warning: Could not load voice profiles: {e}")
+        with self._lock:
+            if self.profiles_file.exists():
+                try:
+                    with open(self.profiles_file, 'r') as f:
+                        data = json.load(f)
+                        for voice_data in data.get("voices", []):
+                            profile = VoiceProfile.from_dict(voice_data)
+                            self.voices[profile.name] = profile
+                except Exception as e:
+                    print(f"Warning: Could not load voice profiles: {e}")
+            self._refresh_voice_list()
     
     def _save_profiles(self):
         """Save voice profiles to JSON file."""
+        # Write to a temp file and swap it in so a crash never leaves partial JSON
+        tmp_file = self.profiles_file.with_suffix(".json.tmp")
         try:
             data = {
                 "voices": [profile.to_dict() for profile in self.voices.values()]
             }
-            with open(self.profiles_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            with open(tmp_file, 'w') as f:
+                json.dump(data, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.profiles_file)
         except Exception as e:
+            tmp_file.unlink(missing_ok=True)
             print(f"Warning: Could not save voice profiles: {e}")
     
     def validate_audio_file(self, file_path: str) -> Tuple[bool, str]:
@@ -133,75 +161,79 @@ class VoiceManager:
         Returns:
             Tuple of (success, message)
         """
-        # Check if we have room for more voices
-        if len(self.voices) >= self.max_voices:
-            return False, f"Maximum {self.max_voices} voices allowed. Delete a voice first."
-        
-        # Check if name already exists
-        if name in self.voices:
-            return False, f"Voice '{name}' already exists. Choose a different name."
-        
-        # Validate the audio file
-        is_valid, message = self.validate_audio_file(source_file)
-        if not is_valid:
-            return False, message
-        
-        try:
-            # Create unique filename
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            safe_name = "".join(c for c in name if c.isalnum() or c in (' ', '-', '_')).rstrip()
-            filename = f"{safe_name}_{timestamp}.wav"
-            target_path = self.voices_dir / filename
+        with self._lock:
+            # Check if we have room for more voices
+            if len(self.voices) >= self.max_voices:
+                return False, f"Maximum {self.max_voices} voices allowed. Delete a voice first."
             
-            # Convert and save as WAV (standardize format)
-            audio, sr = librosa.load(source_file, sr=48000)  # Standardize to 48kHz
-            sf.write(target_path, audio, sr)
+            # Check if name already exists
+            if name in self.voices:
+                return False, f"Voice '{name}' already exists. Choose a different name."
             
-            # Create profile
-            profile = VoiceProfile(name, str(target_path))
-            self.voices[name] = profile
+            # Validate the audio file
+            is_valid, message = self.validate_audio_file(source_file)
+            if not is_valid:
+                return False, message
             
-            # Save profiles
-            self._save_profiles()
-            
-            return True, f"✅ Voice '{name}' added successfully ({profile.duration:.1f}s)"
-            
-        except Exception as e:
-            return False, f"Failed to add voice: {str(e)}"
+            try:
+                # Create unique filename
+                timestamp = time.strftime("%Y%m%d_%H%M%S")
+                safe_name = self._UNSAFE_NAME_CHARS.sub('', name).rstrip()
+                filename = f"{safe_name}_{timestamp}.wav"
+                target_path = self.voices_dir / filename
+                
+                # Convert and save as WAV (standardize format)
+                audio, sr = librosa.load(source_file, sr=48000)  # Standardize to 48kHz
+                sf.write(target_path, audio, sr)
+                
+                # Create profile
+                profile = VoiceProfile(name, str(target_path))
+                self.voices[name] = profile
+                self._refresh_voice_list()
+                
+                # Save profiles
+                self._save_profiles()
+                
+                return True, f"✅ Voice '{name}' added successfully ({profile.duration:.1f}s)"
+                
+            except Exception as e:
+                return False, f"Failed to add voice: {str(e)}"
     
     def delete_voice(self, name: str) -> Tuple[bool, str]:
         """Delete a voice profile and its audio file."""
-        if name not in self.voices:
-            return False, f"Voice '{name}' not found."
-        
-        try:
-            profile = self.voices[name]
-            
-            # Delete audio file if it exists
-            if os.path.exists(profile.file_path):
-                os.remove(profile.file_path)
-            
-            # Remove from profiles
-            del self.voices[name]
-            self._save_profiles()
+        with self._lock:
+            if name not in self.voices:
+                return False, f"Voice '{name}' not found."
             
-            return True, f"✅ Voice '{name}' deleted successfully."
-            
-        except Exception as e:
-            return False, f"Failed to delete voice: {str(e)}"
+            try:
+                profile = self.voices[name]
+                
+                # Delete audio file if it exists
+                if os.path.exists(profile.file_path):
+                    os.remove(profile.file_path)
+                
+                # Remove from profiles
+                del self.voices[name]
+                self._refresh_voice_list()
+                self._save_profiles()
+                
+                return True, f"✅ Voice '{name}' deleted successfully."
+                
+            except Exception as e:
+                return False, f"Failed to delete voice: {str(e)}"
     
-    def get_voice_list(self) -> List[str]:
-        """Get list of available voice names."""
-        return ["Default"] + list(self.voices.keys())
+    def _refresh_voice_list(self):
+        """Rebuild the voice name snapshot; callers must hold self._lock."""
+        self._voice_list_cache = ("Default", *self.voices.keys())
     
-    def get_voice_info(self, name: str) -> Optional[Dict]:
+    def get_voice_list(self) -> Sequence[str]:
+        """Get available voice names as an immutable tuple (rebuilt whenever voices change)."""
+        return self._voice_list_cache
+    
+    def get_voice_info(self, name: str) -> Optional[Mapping]:
         """Get detailed information about a voice."""
         if name == "Default":
-            return {
-                "name": "Default",
-                "type": "built-in",
-                "description": "High-quality default voice"
-            }
+            return _DEFAULT_VOICE_INFO
         
         if name in self.voices:
             profile = self.voices[name]
@@ -3,38 +3,56 @@ Launch script for ChatterboxTTS Desktop Web UI
 """
 
 import os
+import socket
 import sys
-import webbrowser
 import time
-from threading import Timer
+import webbrowser
+from threading import Thread
 
 # Add app directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'app'))
 
 from app.api import app
+from console import console_icon
 import uvicorn
 
 
-def open_browser():
-    """Open browser after a short delay."""
-    time.sleep(2)
+def wait_and_open_browser(timeout: float = 30.0):
+    """Wait until the server accepts connections, then open the browser."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection(("127.0.0.1", 8000), timeout=0.2):
+                break
+        except OSError:
+            time.sleep(0.05)
     webbrowser.open('http://localhost:8000')
 
 
+def open_browser():
+    """Open the browser in the background without blocking server startup."""
+    Thread(target=wait_and_open_browser, daemon=True).start()
+
+
 if __name__ == "__main__":
-    print("=" * 60)
-    print("🗣️  ChatterboxTTS Desktop - Web UI")
-    print("   Professional text-to-speech with voice cloning")
-    print("=" * 60)
-    print()
-    print("🚀 Starting web server...")
-    print("📱 Interface will open at: http://localhost:8000")
-    print()
-    print("Press Ctrl+C to stop the server")
-    print("=" * 60)
+    # Write the banner in one call so startup isn't spent on per-line flushes
+    sys.stdout.write(
+        "=" * 60 + "\n"
+        + console_icon("🗣️ ") + "ChatterboxTTS Desktop - Web UI\n"
+        "   Professional text-to-speech with voice cloning\n"
+        + "=" * 60 + "\n"
+        "\n"
+        + console_icon("🚀") + "Starting web server...\n"
+        + console_icon("📱") + "Interface will open at: http://localhost:8000\n"
+        "\n"
+        "Press Ctrl+C to stop the server\n"
+        + "=" * 60 + "\n"
+    )
+    sys.stdout.flush()
     
-    # Open browser in background
-    Timer(1.5, open_browser).start()
+    # Startup runs before uvicorn binds the socket, so the browser thread
+    # probes the port and opens the page once the server is listening
+    app.add_event_handler("startup", open_browser)
     
     # Start server
     try:
@@ -43,10 +61,11 @@ if __name__ == "__main__":
             host="127.0.0.1",
             port=8000,
             log_level="info",
-            access_log=False  # Reduce console noise
+            access_log=False,  # Reduce console noise
+            workers=1  # Each worker would load its own copy of the model
         )
     except KeyboardInterrupt:
-        print("\n🛑 Server stopped by user")
+        print(f"\n{console_icon('🛑')}Server stopped by user")
     except Exception as e:
-        print(f"\n❌ Server error: {e}")
+        print(f"\n{console_icon('❌')}Server error: {e}")
         sys.exit(1)
\ No newline at end of file
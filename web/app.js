@@ -101,6 +101,8 @@ class ChatterboxApp {
         // Audio player events
         this.audioPlayer.addEventListener('loadedmetadata', () => this.onAudioLoaded());
         this.audioPlayer.addEventListener('timeupdate', () => this.updateTimeDisplay());
+        this.audioPlayer.addEventListener('play', () => this.onPlaybackStateChanged(true));
+        this.audioPlayer.addEventListener('pause', () => this.onPlaybackStateChanged(false));
         this.audioPlayer.addEventListener('ended', () => this.onAudioEnded());
         
         // Export
@@ -201,7 +203,7 @@ class ChatterboxApp {
             // Simulate progress
             this.animateProgress();
             
-            const response = await fetch('/api/generate', {
+            const response = await fetch('/api/generate-bytes', {
                 method: 'POST',
                 headers: {
                     'Content-Type': 'application/json',
@@ -214,15 +216,18 @@ class ChatterboxApp {
                 })
             });
             
-            const result = await response.json();
-            
-            if (result.success) {
-                this.loadGeneratedAudio(result);
-                this.showStatus(result.message, 'success');
-            } else {
-                throw new Error(result.message || 'Generation failed');
+            if (!response.ok) {
+                throw new Error(await this.readErrorDetail(response, 'Generation failed'));
             }
             
+            // Body is the WAV itself; stats come back as headers
+            const audioBlob = await response.blob();
+            const duration = parseFloat(response.headers.get('X-Audio-Duration'));
+            const generationTime = parseFloat(response.headers.get('X-Generation-Time'));
+            
+            this.loadGeneratedAudio(audioBlob);
+            this.showStatus(`Generated ${duration.toFixed(1)}s audio in ${generationTime.toFixed(1)}s`, 'success');
+            
         } catch (error) {
             this.showStatus(`Error: ${error.message}`, 'error');
         } finally {
@@ -231,6 +236,25 @@ class ChatterboxApp {
         }
     }
     
+    async readErrorDetail(response, fallback) {
+        // Error bodies may be non-JSON, and 422 validation errors carry a list of details
+        let result;
+        try {
+            result = await response.json();
+        } catch (error) {
+            return `${fallback} (HTTP ${response.status})`;
+        }
+        
+        const detail = result && result.detail;
+        if (Array.isArray(detail)) {
+            return detail.map(item => item.msg || JSON.stringify(item)).join('; ');
+        }
+        if (detail && typeof detail === 'object') {
+            return JSON.stringify(detail);
+        }
+        return detail || fallback;
+    }
+    
     animateProgress() {
         let progress = 0;
         const interval = setInterval(() => {
@@ -246,21 +270,16 @@ class ChatterboxApp {
         setTimeout(() => clearInterval(interval), 10000);
     }
     
-    loadGeneratedAudio(result) {
-        // Convert base64 to blob
-        const audioData = atob(result.audio_data);
-        const arrayBuffer = new ArrayBuffer(audioData.length);
-        const uint8Array = new Uint8Array(arrayBuffer);
-        
-        for (let i = 0; i < audioData.length; i++) {
-            uint8Array[i] = audioData.charCodeAt(i);
+    loadGeneratedAudio(audioBlob) {
+        // Release the previous clip's object URL
+        if (this.audioPlayer.src.startsWith('blob:')) {
+            URL.revokeObjectURL(this.audioPlayer.src);
         }
         
-        const audioBlob = new Blob([arrayBuffer], { type: 'audio/wav' });
         const audioUrl = URL.createObjectURL(audioBlob);
         
         // Store audio data for export
-        this.audioData = result;
+        this.audioData = audioBlob;
         
         // Load into audio player
         this.audioPlayer.src = audioUrl;
@@ -276,17 +295,19 @@ class ChatterboxApp {
     }
     
     togglePlayPause() {
+        // Button state follows the player's play/pause events
         if (this.audioPlayer.paused) {
             this.audioPlayer.play();
-            this.playPauseBtn.innerHTML = '<i class="fas fa-pause"></i>';
-            this.isPlaying = true;
         } else {
             this.audioPlayer.pause();
-            this.playPauseBtn.innerHTML = '<i class="fas fa-play"></i>';
-            this.isPlaying = false;
         }
     }
     
+    onPlaybackStateChanged(playing) {
+        this.playPauseBtn.innerHTML = playing ? '<i class="fas fa-pause"></i>' : '<i class="fas fa-play"></i>';
+        this.isPlaying = playing;
+    }
+    
     seekAudio() {
         const seekTime = (this.timeline.value / 100) * this.audioPlayer.duration;
         this.audioPlayer.currentTime = seekTime;
@@ -316,8 +337,7 @@ class ChatterboxApp {
     }
     
     onAudioEnded() {
-        this.playPauseBtn.innerHTML = '<i class="fas fa-play"></i>';
-        this.isPlaying = false;
+        this.onPlaybackStateChanged(false);
         this.timeline.value = 0;
     }
     
@@ -334,19 +354,8 @@ class ChatterboxApp {
         }
         
         try {
-            // Convert base64 to blob
-            const audioData = atob(this.audioData.audio_data);
-            const arrayBuffer = new ArrayBuffer(audioData.length);
-            const uint8Array = new Uint8Array(arrayBuffer);
-            
-            for (let i = 0; i < audioData.length; i++) {
-                uint8Array[i] = audioData.charCodeAt(i);
-            }
-            
-            const audioBlob = new Blob([arrayBuffer], { type: 'audio/wav' });
-            
             // Create download link
-            const url = URL.createObjectURL(audioBlob);
+            const url = URL.createObjectURL(this.audioData);
             const a = document.createElement('a');
             a.href = url;
             a.download = `chatterbox_output_${new Date().toISOString().slice(0, 19).replace(/:/g, '-')}.wav`;